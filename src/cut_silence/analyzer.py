@@ -2,18 +2,218 @@
 Video analyzer module for detecting silence in videos.
 """
 
-from pathlib import Path
-from typing import List, Tuple
+from typing import List, NamedTuple, Optional, Tuple
+import functools
+import re
 import subprocess
-import json
 
-from cut_silence.ffmpeg_runner import FFmpegProgressRunner
+import numpy as np
+
+from cut_silence.cache import ProbeCache
+from cut_silence.config import (
+    ADMISSION_SAMPLE_WINDOWS,
+    ADMISSION_WINDOW_DURATION,
+    ADMISSION_MARGIN_DB,
+    SEGMENT_MERGE_GAP,
+)
+from cut_silence.ffmpeg_runner import FFmpegProgressRunner, log_args
+from cut_silence.sources import Source, input_args, is_url
+
+
+# Regex pattern for parsing FFmpeg silencedetect output (start and end events);
+# FFmpeg prints times with %g, so tiny values use exponent notation (e.g. 2e-05)
+SILENCE_RE = re.compile(r'silence_(start|end):\s*(-?[\d.]+(?:[eE][-+]?\d+)?)')
+
+# Regex pattern for parsing FFmpeg astats RMS metadata lines
+RMS_RE = re.compile(r'RMS_level=(\S+)')
+
+
+@functools.lru_cache(maxsize=128)
+def _ffprobe_duration(path: str, size: int, mtime_ns: int) -> float:
+    """
+    Probe a file's duration with ffprobe.
+
+    Size and modification time are only part of the memoization key, so a
+    changed file is probed again.
+
+    Args:
+        path: Path or URL of the video file
+        size: File size in bytes
+        mtime_ns: File modification time in nanoseconds
+
+    Returns:
+        Duration in seconds
+    """
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-show_entries", "format=duration:stream=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",  # Bare values, one per line
+        *input_args(path)
+    ]
+
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+    # One line per stream duration, then the container duration last
+    # ("N/A" where a value is unknown)
+    durations = []
+    for line in result.stdout.strip().splitlines():
+        try:
+            durations.append(float(line))
+        except ValueError:
+            durations.append(None)
+
+    # Prefer the container duration, fall back to the longest stream
+    if durations and durations[-1] is not None:
+        return durations[-1]
+    stream_durations = [d for d in durations[:-1] if d is not None]
+    if stream_durations:
+        return max(stream_durations)
+
+    raise ValueError(f"Could not determine duration of {path}")
+
+
+@functools.lru_cache(maxsize=128)
+def _ffprobe_keyframes(path: str, size: int, mtime_ns: int) -> Tuple[Tuple[float, ...], float, float]:
+    """
+    Probe the keyframe timestamps of a file's first video stream with ffprobe.
+
+    Only packet headers are read (no decoding). Times are shifted by the
+    container start time, which FFmpeg subtracts from every timestamp it
+    passes on, so they line up with silencedetect events. Size and
+    modification time are only part of the memoization key, so a changed
+    file is probed again.
+
+    Args:
+        path: Path or URL of the video file
+        size: File size in bytes
+        mtime_ns: File modification time in nanoseconds
+
+    Returns:
+        Tuple of (sorted keyframe times, typical frame duration, first video
+        timestamp), all in seconds; empty and zeros if there is no video stream
+    """
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "format=start_time:packet=pts_time,duration_time,flags",
+        "-of", "csv=p=0",
+        *input_args(path)
+    ]
+
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+    start_time = 0.0
+    keyframes = []
+    packet_times = []
+    frame_durations = []
+    for line in result.stdout.splitlines():
+        fields = line.split(",")
+        if len(fields) == 1:
+            # The container start time, printed after all packets
+            try:
+                start_time = float(fields[0])
+            except ValueError:
+                pass
+            continue
+
+        # Packet lines look like "12.345000,0.040000,K__"
+        pts_time, duration_time, flags = fields[0], fields[1], fields[-1]
+        if duration_time not in ("", "N/A"):
+            frame_durations.append(float(duration_time))
+        if pts_time in ("", "N/A"):
+            continue
+        packet_times.append(float(pts_time))
+        if "K" in flags:
+            keyframes.append(float(pts_time))
+
+    if not packet_times:
+        return (), 0.0, 0.0
+
+    frame_duration = float(np.median(frame_durations)) if frame_durations else 0.0
+    return (
+        tuple(sorted(time - start_time for time in keyframes)),
+        frame_duration,
+        min(packet_times) - start_time,
+    )
+
+
+class KeyframeInfo(NamedTuple):
+    """Keyframe timing of a video's first video stream, in seconds."""
+
+    times: np.ndarray  # Sorted keyframe times (on the silencedetect timeline)
+    frame_duration: float  # Typical frame duration (0.0 if unknown)
+    video_start: float  # First video timestamp (the segment muxer counts split times from here)
+
+
+class _SilenceParser:
+    """Incrementally parses FFmpeg silencedetect output into silence segments."""
+
+    def __init__(self, min_duration: float = 0.0, padding: float = 0.0):
+        """
+        Initialize silence parser.
+
+        Args:
+            min_duration: Silences shorter than this are dropped
+            padding: Padding later added around speech; silences no longer
+                than twice this would collapse to nothing and are dropped
+        """
+        self.min_duration = min_duration
+        self.collapse_duration = 2 * padding
+        self.segments: List[Tuple[float, float]] = []
+        self.skipped = 0
+        self._silence_start = None
+
+    def feed(self, line: str) -> None:
+        """
+        Parse a single line of FFmpeg stderr output.
+
+        A trailing silence_start without a matching silence_end is dropped, as
+        are silences too short to be cut.
+
+        Args:
+            line: FFmpeg stderr line
+        """
+        match = SILENCE_RE.search(line)
+        if match is None:
+            return
+
+        key, value = match.group(1), float(match.group(2))
+        if key == "start":
+            self._silence_start = value
+        elif self._silence_start is not None:
+            # FFmpeg occasionally reports silences shorter than requested
+            duration = value - self._silence_start
+            if duration < self.min_duration or duration <= self.collapse_duration:
+                self.skipped += 1
+            else:
+                self.segments.append((self._silence_start, value))
+            self._silence_start = None
 
 
 class VideoAnalyzer:
     """Analyzes videos to detect silent segments."""
 
-    def __init__(self, threshold: float, min_duration: float, verbose: bool = False, max_duration: float = None):
+    def __init__(
+        self,
+        threshold: float,
+        min_duration: float,
+        verbose: bool = False,
+        max_duration: float = None,
+        padding: float = 0.0,
+        admission_filter: bool = False,
+    ):
         """
         Initialize video analyzer.
 
@@ -22,18 +222,25 @@ class VideoAnalyzer:
             min_duration: Minimum silence duration in seconds
             verbose: Enable verbose output
             max_duration: Maximum duration to analyze in seconds (None for entire video)
+            padding: Padding that will be kept around speech in seconds
+            admission_filter: Sample the audio first and skip the full scan when
+                it is clearly never silent (opt-in: the samples can miss silences
+                between them)
         """
         self.threshold = threshold
         self.min_duration = min_duration
         self.verbose = verbose
         self.max_duration = max_duration
+        self.padding = padding
+        self.admission_filter = admission_filter
+        self.cache = ProbeCache()
 
-    def detect_silence(self, video_path: Path, show_progress: bool = True) -> List[Tuple[float, float]]:
+    def detect_silence(self, video_path: Source, show_progress: bool = True) -> List[Tuple[float, float]]:
         """
         Detect silent segments in the video.
 
         Args:
-            video_path: Path to the video file
+            video_path: Path or URL of the video file
             show_progress: Whether to show progress bar
 
         Returns:
@@ -52,98 +259,188 @@ class VideoAnalyzer:
             if self.verbose:
                 print(f"Limiting analysis to first {analyze_duration:.2f}s")
 
+        # Cheap early exit for audio that never gets close to the threshold
+        if self.admission_filter:
+            min_rms = self.quick_silence_estimate(video_path, analyze_duration)
+            if min_rms is not None and min_rms > self.threshold + ADMISSION_MARGIN_DB:
+                if self.verbose:
+                    print(f"Sampled audio never drops below {min_rms:.1f}dB, skipping silence detection")
+                return []
+
+        # Add time limit if max_duration is specified
+        time_limit = ["-t", str(self.max_duration)] if self.max_duration is not None else []
+
         # Use FFmpeg's silencedetect filter to find silent segments
+        # (silencedetect logs at info level, so keep that level even without progress)
         cmd = [
             "ffmpeg",
-            "-i", str(video_path),
+            *log_args(show_progress, loglevel="info"),
+            *input_args(video_path),
+            *time_limit,
+            "-vn", "-sn", "-dn",  # Only decode audio, skip video/subtitle/data streams
             "-af", f"silencedetect=noise={self.threshold}dB:d={self.min_duration}",
             "-f", "null",
             "-"
         ]
 
-        # Add time limit if max_duration is specified
-        if self.max_duration is not None:
-            cmd.insert(-2, "-t")  # Insert before "-"
-            cmd.insert(-2, str(self.max_duration))
-
-        # Run FFmpeg with progress tracking
+        # Run FFmpeg with progress tracking, parsing silence events as they are logged
+        parser = _SilenceParser(self.min_duration, self.padding)
         runner = FFmpegProgressRunner()
-        result = runner.run_with_progress(
+        runner.run_with_progress(
             cmd=cmd,
             description="Detecting silence",
             total_duration=analyze_duration,
-            show_progress=show_progress
+            show_progress=show_progress,
+            line_callback=parser.feed
         )
 
-        # Parse the output to extract silence segments
-        silent_segments = self._parse_silence_output(result.stderr)
+        silent_segments = parser.segments
 
         if self.verbose:
             print(f"Found {len(silent_segments)} silent segments")
+            if parser.skipped:
+                print(f"Ignored {parser.skipped} silent segment(s) too short to cut")
 
         return silent_segments
 
-    def _parse_silence_output(self, stderr: str) -> List[Tuple[float, float]]:
+    def quick_silence_estimate(self, video_path: Source, duration: float) -> Optional[float]:
         """
-        Parse FFmpeg silencedetect output to extract silence segments.
+        Estimate the quietest audio level by sampling a few short windows.
+
+        The windows are spread evenly over the video, downmixed to 8kHz mono and
+        measured per audio frame with astats, all in one FFmpeg call.
 
         Args:
-            stderr: FFmpeg stderr output
+            video_path: Path or URL of the video file
+            duration: Duration of the video to sample from in seconds
 
         Returns:
-            List of tuples (start_time, end_time) representing silent segments
+            Lowest RMS level seen in dB, or None if it could not be measured
         """
-        silent_segments = []
-        silence_start = None
-
-        for line in stderr.split('\n'):
-            if 'silencedetect' in line:
-                if 'silence_start' in line:
-                    # Extract start time
-                    parts = line.split('silence_start: ')
-                    if len(parts) > 1:
-                        silence_start = float(parts[1].strip().split()[0])
-                elif 'silence_end' in line and silence_start is not None:
-                    # Extract end time
-                    parts = line.split('silence_end: ')
-                    if len(parts) > 1:
-                        silence_end = float(parts[1].strip().split()[0])
-                        silent_segments.append((silence_start, silence_end))
-                        silence_start = None
+        window = ADMISSION_WINDOW_DURATION
+        count = ADMISSION_SAMPLE_WINDOWS
+
+        if duration <= window * count:
+            # Short video, just measure all of it
+            window_starts = [0.0]
+            window = duration
+        else:
+            step = duration / count
+            window_starts = [i * step + (step - window) / 2 for i in range(count)]
+
+        inputs = []
+        for start_time in window_starts:
+            inputs.extend([
+                "-ss", str(start_time),
+                "-t", str(window),
+                *input_args(video_path),
+            ])
+
+        audio_inputs = "".join(f"[{idx}:a]" for idx in range(len(window_starts)))
+        cmd = [
+            "ffmpeg",
+            *log_args(show_progress=False),
+            *inputs,
+            "-filter_complex",
+            f"{audio_inputs}concat=n={len(window_starts)}:v=0:a=1,"
+            "aresample=8000,aformat=channel_layouts=mono,"
+            "astats=metadata=1:reset=1,"
+            "ametadata=print:key=lavfi.astats.Overall.RMS_level:file=-",
+            "-f", "null",
+            "-"
+        ]
 
-        return silent_segments
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+
+        if result.returncode != 0:
+            return None
 
-    def get_video_duration(self, video_path: Path) -> float:
+        levels = []
+        for match in RMS_RE.finditer(result.stdout):
+            try:
+                levels.append(float(match.group(1)))  # "-inf" for digital silence
+            except ValueError:
+                continue
+
+        return min(levels) if levels else None
+
+    def get_video_duration(self, video_path: Source) -> float:
         """
         Get the total duration of the video.
 
+        Results for local files are cached on disk keyed by path, size and
+        modification time, so repeated runs on the same file skip ffprobe.
+
         Args:
-            video_path: Path to the video file
+            video_path: Path or URL of the video file
 
         Returns:
             Duration in seconds
         """
-        cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "json",
-            str(video_path)
-        ]
+        if is_url(video_path):
+            # Remote files can't be stat'ed, only memoize for this run
+            return _ffprobe_duration(video_path, 0, 0)
 
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+        duration = self.cache.get(video_path, "duration")
+        if duration is not None:
+            return duration
 
-        data = json.loads(result.stdout)
-        duration = float(data["format"]["duration"])
+        stat = video_path.stat()
+        duration = _ffprobe_duration(str(video_path), stat.st_size, stat.st_mtime_ns)
+        self.cache.set(video_path, duration=duration)
         return duration
 
+    def get_keyframe_times(self, video_path: Source) -> KeyframeInfo:
+        """
+        Get the keyframe timestamps of the video.
+
+        Results are cached on disk like the video duration (in a separate array
+        file), so the probe runs once per file no matter how many segments are
+        cut from it.
+
+        Args:
+            video_path: Path or URL of the video file
+
+        Returns:
+            Keyframe times and the frame timing needed to split on them
+        """
+        if is_url(video_path):
+            # Remote files can't be stat'ed, only memoize for this run
+            keyframe_times, frame_duration, video_start = _ffprobe_keyframes(video_path, 0, 0)
+            keyframes = np.asarray(keyframe_times, dtype=np.float64)
+        else:
+            keyframes = self.cache.get_array(video_path, "keyframes")
+            frame_duration = self.cache.get(video_path, "frame_duration")
+            video_start = self.cache.get(video_path, "video_start")
+
+        if keyframes is None or frame_duration is None or video_start is None:
+            stat = video_path.stat()
+            keyframe_times, frame_duration, video_start = _ffprobe_keyframes(
+                str(video_path), stat.st_size, stat.st_mtime_ns
+            )
+            keyframes = np.asarray(keyframe_times, dtype=np.float64)
+            self.cache.set_array(
+                video_path, "keyframes", keyframes, frame_duration=frame_duration, video_start=video_start
+            )
+
+        if self.verbose:
+            print(f"Found {len(keyframes)} keyframes")
+
+        return KeyframeInfo(keyframes, frame_duration, video_start)
+
     def calculate_non_silent_segments(
-        self, silent_segments: List[Tuple[float, float]], total_duration: float, padding: float = 0.0, min_segment_duration: float = 0.1
+        self,
+        silent_segments: List[Tuple[float, float]],
+        total_duration: float,
+        padding: float = 0.0,
+        min_segment_duration: float = 0.1,
+        keyframes: Optional[np.ndarray] = None,
+        merge_gap: float = SEGMENT_MERGE_GAP,
     ) -> List[Tuple[float, float]]:
         """
         Calculate non-silent segments from silent segments.
@@ -153,6 +450,10 @@ class VideoAnalyzer:
             total_duration: Total video duration in seconds
             padding: Padding to add around speech in seconds
             min_segment_duration: Minimum duration for a segment to be included (default: 0.1s)
+            keyframes: Optional sorted keyframe times; segments are widened to
+                keyframe boundaries (see align_to_keyframes)
+            merge_gap: Segments separated by no more than this are merged into one
+                (gaps are measured after padding, so this is not scaled by it)
 
         Returns:
             List of (start, end) tuples for non-silent segments
@@ -166,30 +467,126 @@ class VideoAnalyzer:
             # No silence detected, return entire video (up to max_duration)
             return [(0.0, effective_duration)]
 
-        non_silent_segments = []
-        current_time = 0.0
-
-        for silence_start, silence_end in silent_segments:
-            # Add padding around silence (shrink the silent region)
-            adjusted_start = max(0.0, silence_start + padding)
-            adjusted_end = min(effective_duration, silence_end - padding)
-
-            # Only add non-silent segment if there's actual content and it meets minimum duration
-            if current_time < adjusted_start:
-                duration = adjusted_start - current_time
-                if duration >= min_segment_duration:
-                    non_silent_segments.append((current_time, adjusted_start))
-                elif self.verbose:
-                    print(f"Skipping short segment ({duration:.3f}s) from {current_time:.2f}s to {adjusted_start:.2f}s")
-
-            current_time = adjusted_end
-
-        # Add final segment if there's content after last silence
-        if current_time < effective_duration:
-            duration = effective_duration - current_time
-            if duration >= min_segment_duration:
-                non_silent_segments.append((current_time, effective_duration))
-            elif self.verbose:
-                print(f"Skipping short segment ({duration:.3f}s) from {current_time:.2f}s to {effective_duration:.2f}s")
-
-        return non_silent_segments
+        silences = np.asarray(silent_segments, dtype=np.float64)
+
+        # Add padding around silence (shrink the silent region)
+        adjusted_starts = np.maximum(0.0, silences[:, 0] + padding)
+        adjusted_ends = np.minimum(effective_duration, silences[:, 1] - padding)
+
+        # Content runs from the end of each silence to the start of the next one
+        starts = np.concatenate(([0.0], adjusted_ends))
+        ends = np.concatenate((adjusted_starts, [effective_duration]))
+        durations = ends - starts
+
+        # Only keep segments with actual content that meet the minimum duration
+        has_content = durations > 0
+        keep = has_content & (durations >= min_segment_duration)
+
+        if self.verbose:
+            for start, end in zip(starts[has_content & ~keep], ends[has_content & ~keep]):
+                print(f"Skipping short segment ({end - start:.3f}s) from {start:.2f}s to {end:.2f}s")
+
+        starts, ends = starts[keep], ends[keep]
+
+        starts, ends = self._merge_close_segments(starts, ends, merge_gap)
+        segments = list(zip(starts.tolist(), ends.tolist()))
+
+        if keyframes is not None:
+            segments = self.align_to_keyframes(segments, keyframes, total_duration, merge_gap)
+
+        return segments
+
+    def align_to_keyframes(
+        self,
+        segments: List[Tuple[float, float]],
+        keyframes: np.ndarray,
+        total_duration: float,
+        merge_gap: float = SEGMENT_MERGE_GAP,
+    ) -> List[Tuple[float, float]]:
+        """
+        Widen non-silent segments to keyframe boundaries.
+
+        Stream copy cuts then land exactly on the segment boundaries, and
+        segments that overlap afterwards are merged.
+
+        Args:
+            segments: List of (start, end) tuples, in timeline order
+            keyframes: Sorted keyframe times
+            total_duration: Total video duration in seconds
+            merge_gap: Segments separated by no more than this are merged into one
+
+        Returns:
+            List of (start, end) tuples for the widened segments
+        """
+        if not segments or len(keyframes) == 0:
+            return list(segments)
+
+        effective_duration = total_duration
+        if self.max_duration is not None:
+            effective_duration = min(self.max_duration, total_duration)
+
+        bounds = np.asarray(segments, dtype=np.float64)
+        starts, ends = self._snap_to_keyframes(bounds[:, 0], bounds[:, 1], keyframes, effective_duration)
+        starts, ends = self._merge_close_segments(starts, ends, merge_gap)
+
+        return list(zip(starts.tolist(), ends.tolist()))
+
+    def _snap_to_keyframes(
+        self, starts: np.ndarray, ends: np.ndarray, keyframes: np.ndarray, effective_duration: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Widen segments to keyframe boundaries.
+
+        Neighbours may overlap afterwards, the merge pass joins them.
+
+        Args:
+            starts: Segment start times
+            ends: Segment end times
+            keyframes: Sorted keyframe times
+            effective_duration: Upper bound for segment end times
+
+        Returns:
+            Tuple of (starts, ends) arrays
+        """
+        # Move each start back to the keyframe at or before it
+        start_idx = np.searchsorted(keyframes, starts, side='right') - 1
+        snapped_starts = np.where(start_idx >= 0, keyframes[np.maximum(start_idx, 0)], starts)
+
+        # Move each end forward to the keyframe at or after it (or leave it at the end)
+        end_idx = np.searchsorted(keyframes, ends, side='left')
+        has_next = end_idx < len(keyframes)
+        snapped_ends = np.where(has_next, keyframes[np.minimum(end_idx, len(keyframes) - 1)], ends)
+        snapped_ends = np.minimum(snapped_ends, effective_duration)
+
+        return snapped_starts, snapped_ends
+
+    def _merge_close_segments(
+        self, starts: np.ndarray, ends: np.ndarray, merge_gap: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Merge segments that overlap or are separated by at most merge_gap.
+
+        Each merge saves one extracted segment (and its ffmpeg work) later on.
+
+        Args:
+            starts: Segment start times, in timeline order
+            ends: Segment end times
+            merge_gap: Largest gap in seconds that is merged away
+
+        Returns:
+            Tuple of (starts, ends) arrays
+        """
+        if len(starts) < 2:
+            return starts, ends
+
+        # A segment starts a new group unless it begins within merge_gap of
+        # the furthest end seen so far
+        gaps = starts[1:] - np.maximum.accumulate(ends)[:-1]
+        new_group = np.concatenate(([True], gaps > merge_gap))
+        group_starts = np.flatnonzero(new_group)
+
+        merged_count = len(starts) - len(group_starts)
+        if self.verbose and merged_count:
+            print(f"Merged {merged_count} segment(s) into their neighbours (gap <= {merge_gap:.3f}s)")
+
+        return starts[group_starts], np.maximum.reduceat(ends, group_starts)
@@ -0,0 +1,200 @@
+"""
+Probe cache module for reusing ffprobe results across runs.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from cut_silence.config import CACHE_DIR, PROBE_CACHE_FILE, PROBE_CACHE_ARRAY_DIR, PROBE_CACHE_MAX_ENTRIES
+
+
+class ProbeCache:
+    """
+    Small on-disk JSON cache of ffprobe results.
+
+    Entries are keyed by file path and invalidated when the file's size or
+    modification time changes, so re-running on the same file skips ffprobe.
+    Only small values live in the JSON index. Large arrays (keyframe lists) are
+    stored as separate .npy files that the index points to, and the index keeps
+    at most PROBE_CACHE_MAX_ENTRIES files, dropping the least recently stored.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        """
+        Initialize probe cache.
+
+        Args:
+            cache_file: Path to the JSON cache file (defaults to the user cache dir)
+        """
+        self.cache_file = cache_file or CACHE_DIR / PROBE_CACHE_FILE
+        self.array_dir = self.cache_file.parent / PROBE_CACHE_ARRAY_DIR
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty: Set[str] = set()
+
+    def get(self, path: Path, field: str) -> Optional[Any]:
+        """
+        Look up a cached value for a file.
+
+        Args:
+            path: Path to the probed file
+            field: Name of the cached value (e.g. "duration")
+
+        Returns:
+            Cached value, or None if missing or the file has changed
+        """
+        entry = self._valid_entry(path)
+        if entry is None:
+            return None
+        return entry.get(field)
+
+    def get_array(self, path: Path, field: str) -> Optional[np.ndarray]:
+        """
+        Look up a cached array for a file.
+
+        Args:
+            path: Path to the probed file
+            field: Name of the cached array (e.g. "keyframes")
+
+        Returns:
+            Cached array, or None if missing or the file has changed
+        """
+        entry = self._valid_entry(path)
+        if entry is None or field not in entry.get("arrays", {}):
+            return None
+
+        try:
+            return np.load(self.array_dir / entry["arrays"][field], allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, path: Path, **values: Any) -> None:
+        """
+        Store values for a file and write the cache back to disk.
+
+        Args:
+            path: Path to the probed file
+            **values: JSON-serializable values to store, by name
+        """
+        self._entry_for_update(path).update(values)
+        self._save()
+
+    def set_array(self, path: Path, field: str, array: np.ndarray, **values: Any) -> None:
+        """
+        Store an array (and optionally small values) for a file.
+
+        The array is written to its own file, the JSON index only records its name.
+
+        Args:
+            path: Path to the probed file
+            field: Name of the cached array
+            array: Array to store
+            **values: JSON-serializable values to store alongside it
+        """
+        entry = self._entry_for_update(path)
+        file_name = f"{hashlib.sha1(self._key(path).encode()).hexdigest()}_{field}.npy"
+
+        try:
+            self.array_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.array_dir, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, np.asarray(array), allow_pickle=False)
+            os.replace(tmp_name, self.array_dir / file_name)
+        except OSError:
+            # Caching is best-effort, never fail processing because of it
+            return
+
+        entry.setdefault("arrays", {})[field] = file_name
+        entry.update(values)
+        self._save()
+
+    def _valid_entry(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Get the entry for a file, or None if missing or the file has changed."""
+        entry = self._load().get(self._key(path))
+        if entry is None or not self._matches(entry, path):
+            return None
+        return entry
+
+    def _entry_for_update(self, path: Path) -> Dict[str, Any]:
+        """Get the entry for a file to store into, marking it most recently stored."""
+        entries = self._load()
+        key = self._key(path)
+        entry = entries.pop(key, None)
+
+        # Start a fresh entry if the file changed since it was cached
+        if entry is None or not self._matches(entry, path):
+            if entry is not None:
+                self._remove_arrays(entry)
+            stat = path.stat()
+            entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+        # Re-inserting keeps the dict ordered from least to most recently stored
+        entries[key] = entry
+        self._dirty.add(key)
+        return entry
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load cache entries from disk on first use."""
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Read cache entries from disk."""
+        try:
+            with open(self.cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # Missing or corrupt cache, start empty
+            return {}
+
+    def _save(self) -> None:
+        """Merge our changes into the cache on disk and write it back atomically."""
+        # Other runs (e.g. parallel files) may have stored entries since we
+        # loaded, re-read so only the entries we changed are overwritten
+        entries = self._read()
+        for key in self._dirty:
+            entries.pop(key, None)
+            entries[key] = self._entries[key]
+
+        # Evict the least recently stored entries over the limit
+        while len(entries) > PROBE_CACHE_MAX_ENTRIES:
+            oldest = next(iter(entries))
+            self._remove_arrays(entries.pop(oldest))
+
+        self._entries = entries
+        self._dirty.clear()
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_name, self.cache_file)
+        except OSError:
+            # Caching is best-effort, never fail processing because of it
+            pass
+
+    def _remove_arrays(self, entry: Dict[str, Any]) -> None:
+        """Delete the array files an entry points to."""
+        for file_name in entry.get("arrays", {}).values():
+            try:
+                (self.array_dir / file_name).unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        """Build the cache key for a file."""
+        return str(path.resolve())
+
+    @staticmethod
+    def _matches(entry: Dict[str, Any], path: Path) -> bool:
+        """Check whether a cache entry still describes the file on disk."""
+        stat = path.stat()
+        return entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
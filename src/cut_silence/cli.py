@@ -3,23 +3,35 @@ CLI parser and main entry point for Cut-Silence.
 """
 
 import argparse
+import asyncio
+import contextlib
+import functools
+import os
 import sys
 import tempfile
+import threading
 import shutil
 import json
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from tqdm import tqdm
 
 from cut_silence.config import (
     DEFAULT_SILENCE_THRESHOLD,
     DEFAULT_MIN_SILENCE_DURATION,
     DEFAULT_PADDING,
     OUTPUT_SUFFIX,
+    DEFAULT_PARALLEL,
+    TMPFS_ROOT,
+    TMPFS_MAX_FRACTION,
 )
 from cut_silence.analyzer import VideoAnalyzer
 from cut_silence.processor import SegmentProcessor
 from cut_silence.concatenator import VideoConcatenator
 from cut_silence.progress import ProgressReporter
+from cut_silence.sources import Source, is_url, local_name, parse_input, resolve_input
 
 
 def parse_arguments(args: List[str] = None) -> argparse.Namespace:
@@ -32,18 +44,21 @@ def parse_arguments(args: List[str] = None) -> argparse.Namespace:
 Examples:
   cut-silence video.mp4                     # Process single video
   cut-silence *.mp4                         # Process multiple videos
+  cut-silence *.mp4 -j 4                    # Process 4 videos at a time
   cut-silence video.mp4 --threshold -35     # Custom silence threshold
   cut-silence video.mp4 --padding 0.3       # Add padding around speech
   cut-silence video.mp4 --first-minutes 5   # Process first 5 minutes only
   cut-silence video.mp4 --dry-run           # Preview without processing
+  cut-silence https://host/video.mp4        # Stream a remote video
+  cut-silence video.mp4 --accurate          # Frame-accurate cuts (re-encodes)
         """,
     )
 
     parser.add_argument(
         "input_files",
         nargs="+",
-        type=Path,
-        help="Input video file(s) to process",
+        type=parse_input,
+        help="Input video file(s) or http(s)/s3 URL(s) to process",
     )
 
     parser.add_argument(
@@ -89,10 +104,45 @@ Examples:
         help="Show what would be removed without processing",
     )
 
+    parser.add_argument(
+        "--accurate",
+        action="store_true",
+        help="Cut on exact frames in a single pass (re-encodes the output)",
+    )
+
+    parser.add_argument(
+        "--keep-all-streams",
+        action="store_true",
+        help="Keep all streams (extra audio tracks, subtitles) instead of only the main video and audio",
+    )
+
+    parser.add_argument(
+        "--tmp-dir",
+        type=Path,
+        help="Directory for intermediate segment files (default: RAM-backed /dev/shm when it fits, else system temp)",
+    )
+
+    parser.add_argument(
+        "--admission-filter",
+        action="store_true",
+        help="Sample the audio first and skip silence detection if no sample is quiet "
+             "(faster on continuous speech, but can miss silences between the samples)",
+    )
+
     parser.add_argument(
         "--export-segments",
         type=Path,
-        help="Export segment timestamps to JSON file",
+        metavar="FILE",
+        help="Export segment timestamps to JSON file (stream copy runs also list the "
+             "keyframe-aligned ranges that are cut; with several inputs, FILE_<input>.json per input)",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--parallel",
+        type=int,
+        default=DEFAULT_PARALLEL,
+        help=f"Number of files to process in parallel (default: {DEFAULT_PARALLEL})",
     )
 
     parser.add_argument(
@@ -124,8 +174,21 @@ def validate_arguments(args: argparse.Namespace) -> None:
             print("Error: --first-minutes must be a positive number", file=sys.stderr)
             sys.exit(1)
 
-    # Check if all input files exist
+    # Validate tmp-dir argument
+    if args.tmp_dir is not None and not args.tmp_dir.is_dir():
+        print(f"Error: Not a directory: {args.tmp_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    # Validate parallel argument
+    if args.parallel < 1:
+        print("Error: --parallel must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    # Check if all input files exist (URLs are opened by FFmpeg directly)
     for input_file in args.input_files:
+        if is_url(input_file):
+            continue
+
         if not input_file.exists():
             print(f"Error: Input file not found: {input_file}", file=sys.stderr)
             sys.exit(1)
@@ -134,10 +197,31 @@ def validate_arguments(args: argparse.Namespace) -> None:
             print(f"Error: Not a file: {input_file}", file=sys.stderr)
             sys.exit(1)
 
+    # Make sure s3:// URLs can be presigned before processing starts (the
+    # presigned URLs are only handed to FFmpeg, never printed or exported)
+    try:
+        for input_file in args.input_files:
+            resolve_input(input_file)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+class _VideoPlan(NamedTuple):
+    """Result of analyzing a video: what to keep and the durations involved."""
 
-def process_video(
-    input_file: Path,
+    total_duration: float
+    silent_segments: List[Tuple[float, float]]
+    non_silent_segments: List[Tuple[float, float]]
+    output_duration: float
+    segment_time_delta: float = 0.0
+    segment_time_offset: float = 0.0
+
+
+def _plan_video(
+    input_file: Source,
     output_file: Path,
+    *,
     threshold: float,
     min_duration: float,
     padding: float,
@@ -145,15 +229,19 @@ def process_video(
     dry_run: bool,
     export_segments_path: Path = None,
     first_minutes: float = None,
-) -> bool:
+    accurate: bool = False,
+    admission_filter: bool = False,
+    show_progress: bool = True,
+) -> Optional[_VideoPlan]:
     """
-    Process a single video file to remove silence.
+    Analyze a video and decide which segments to keep (steps 1-3).
+
+    Also handles segment export and the dry-run preview.
 
     Returns:
-        True if processing was successful, False otherwise
+        The plan to render, or None if there is nothing to render (dry-run
+        finished or no non-silent segments found)
     """
-    print(f"\nProcessing: {input_file}")
-
     # Calculate max duration if first_minutes is specified
     max_duration = None
     if first_minutes is not None:
@@ -162,88 +250,316 @@ def process_video(
             print(f"Processing first {first_minutes} minutes ({max_duration:.1f}s) only")
 
     # Initialize components
-    analyzer = VideoAnalyzer(threshold, min_duration, verbose, max_duration)
-    processor = SegmentProcessor(verbose)
-    concatenator = VideoConcatenator(verbose)
+    analyzer = VideoAnalyzer(threshold, min_duration, verbose, max_duration, padding, admission_filter)
     reporter = ProgressReporter(verbose)
 
-    try:
-        # Step 1: Get video duration
+    # Step 1: Get video duration
+    if verbose:
+        print("Getting video duration...")
+    total_duration = analyzer.get_video_duration(input_file)
+    if verbose:
+        print(f"Video duration: {total_duration:.2f}s")
+
+    # Check if first_minutes exceeds video duration
+    if max_duration is not None and max_duration > total_duration:
+        print(f"Warning: --first-minutes ({first_minutes:.1f}m) exceeds video duration ({total_duration/60:.1f}m)")
+        print(f"Processing entire video instead")
+        max_duration = None
+
+    # Step 2: Detect silence
+    if verbose:
+        print("Detecting silence...")
+    silent_segments = analyzer.detect_silence(input_file, show_progress=show_progress)
+
+    # Step 3: Calculate non-silent segments
+    speech_segments = analyzer.calculate_non_silent_segments(silent_segments, total_duration, padding)
+
+    # Stream copy can only cut on keyframes, so align segments to them up front
+    # (re-encoding cuts on any frame and doesn't need this). The probe reads
+    # every packet, so skip it when nothing is cut, and for URLs where it would
+    # download the whole file once more (FFmpeg then splits on the next keyframe)
+    non_silent_segments = speech_segments
+    segment_time_delta = segment_time_offset = 0.0
+    if not accurate and not dry_run and not is_url(input_file):
         if verbose:
-            print("Getting video duration...")
-        total_duration = analyzer.get_video_duration(input_file)
+            print("Probing keyframes...")
+        keyframe_info = analyzer.get_keyframe_times(input_file)
+        non_silent_segments = analyzer.align_to_keyframes(speech_segments, keyframe_info.times, total_duration)
+        # Still split on keyframes that timestamp rounding reports slightly after
+        # a boundary (half a frame, as recommended for keyframe-aligned split times)
+        segment_time_delta = keyframe_info.frame_duration / 2
+        segment_time_offset = keyframe_info.video_start
+    elif verbose and not accurate and not dry_run:
+        print("Remote input, not probing keyframes (cuts land on the next keyframe)")
+
+    if verbose or dry_run:
+        print(f"\nFound {len(silent_segments)} silent segment(s)")
+        print(f"Keeping {len(non_silent_segments)} non-silent segment(s)")
+
+    # Export segments if requested
+    if export_segments_path:
+        export_data = {
+            "input_file": str(input_file),
+            "total_duration": total_duration,
+            "silent_segments": silent_segments,
+            "non_silent_segments": speech_segments,
+        }
+        if non_silent_segments is not speech_segments:
+            # The ranges actually cut, widened to keyframes
+            export_data["keyframe_aligned_segments"] = non_silent_segments
+        with open(export_segments_path, 'w') as f:
+            json.dump(export_data, f, indent=2)
         if verbose:
-            print(f"Video duration: {total_duration:.2f}s")
+            print(f"Exported segments to: {export_segments_path}")
 
-        # Check if first_minutes exceeds video duration
-        if max_duration is not None and max_duration > total_duration:
-            print(f"Warning: --first-minutes ({first_minutes:.1f}m) exceeds video duration ({total_duration/60:.1f}m)")
-            print(f"Processing entire video instead")
-            max_duration = None
+    # Calculate statistics
+    silence_duration = sum(end - start for start, end in silent_segments)
+    output_duration = sum(end - start for start, end in non_silent_segments)
 
-        # Step 2: Detect silence
-        if verbose:
-            print("Detecting silence...")
-        silent_segments = analyzer.detect_silence(input_file, show_progress=True)
+    if dry_run:
+        print(f"\nDry-run preview:")
+        if max_duration is not None:
+            print(f"  Processing duration: {reporter._format_time(max_duration)} (limited)")
+            print(f"  Original duration:   {reporter._format_time(total_duration)}")
+        else:
+            print(f"  Original duration:   {reporter._format_time(total_duration)}")
+        print(f"  Silence detected:    {reporter._format_time(silence_duration)}")
+        print(f"  Output duration:     {reporter._format_time(output_duration)}")
+        effective_total = max_duration if max_duration is not None else total_duration
+        reduction = (silence_duration / effective_total * 100) if effective_total > 0 else 0
+        print(f"  Reduction:           {reduction:.1f}%")
+        print(f"\nOutput would be saved to: {output_file}")
+        return None
+
+    # Check if there's anything to process
+    if not non_silent_segments:
+        print("\nWarning: No non-silent segments found.")
+        print("The video appears to be entirely silent or audio is very quiet.")
+        print(f"Try adjusting the threshold (current: {threshold}dB)")
+        print("Suggestion: Use a lower threshold like -40dB or -50dB")
+        print("Example: cut-silence input.mp4 --threshold -40")
+        return None
+
+    return _VideoPlan(
+        total_duration, silent_segments, non_silent_segments, output_duration,
+        segment_time_delta, segment_time_offset,
+    )
+
+
+# Bytes of tmpfs promised to videos that are still being processed, so that
+# concurrent files (-j) can't all claim the same free space at once
+_tmpfs_reserved = 0
+_tmpfs_lock = threading.Lock()
+
+
+def _choose_temp_root(expected_bytes: int) -> Optional[str]:
+    """
+    Pick where to put intermediate segment files.
+
+    Uses tmpfs (RAM) when the segments take less than half of its free space,
+    so they never hit the disk between extraction and concatenation. Space
+    reserved by other videos in flight counts as used; a successful pick
+    reserves expected_bytes until _release_temp_root is called.
+
+    Args:
+        expected_bytes: Estimated peak size of the segment files
+
+    Returns:
+        Directory to create the temp dir in, or None for the system default
+    """
+    global _tmpfs_reserved
+
+    with _tmpfs_lock:
+        try:
+            stats = os.statvfs(TMPFS_ROOT)
+        except (AttributeError, OSError):
+            # No statvfs (Windows) or no tmpfs mount
+            return None
+
+        free_bytes = stats.f_bavail * stats.f_frsize
+        if _tmpfs_reserved + expected_bytes < TMPFS_MAX_FRACTION * free_bytes:
+            _tmpfs_reserved += expected_bytes
+            return TMPFS_ROOT
+        return None
+
+
+def _release_temp_root(reserved_bytes: int) -> None:
+    """
+    Give back tmpfs space reserved by _choose_temp_root.
+
+    Args:
+        reserved_bytes: The expected_bytes of the reservation
+    """
+    global _tmpfs_reserved
+
+    with _tmpfs_lock:
+        _tmpfs_reserved -= reserved_bytes
+
+
+@contextlib.contextmanager
+def _temp_dir(input_file: Source, plan: _VideoPlan, tmp_dir: Path = None) -> Iterator[Path]:
+    """
+    Create the temporary directory for a video's segment files.
+
+    The directory (and any tmpfs reservation for it) is removed on exit.
+
+    Args:
+        input_file: Input video path or URL
+        plan: Analysis result, used to estimate the segment size
+        tmp_dir: User-specified parent directory (overrides the automatic choice)
+
+    Yields:
+        Path to the new temporary directory
+    """
+    temp_root = str(tmp_dir) if tmp_dir is not None else None
+    reserved_bytes = 0
+
+    if temp_root is None and not is_url(input_file) and plan.total_duration > 0:
+        # Segments are stream copies, and the segment muxer writes every piece
+        # up to the last kept end (silent ones too, they are deleted after it
+        # finishes), so the peak size scales with that end, not the kept duration
+        input_size = input_file.stat().st_size
+        last_end = plan.non_silent_segments[-1][1]
+        expected_bytes = int(min(last_end / plan.total_duration, 1.0) * input_size)
+        temp_root = _choose_temp_root(expected_bytes)
+        if temp_root is not None:
+            reserved_bytes = expected_bytes
+
+    try:
+        temp_dir = Path(tempfile.mkdtemp(prefix="cut_silence_", dir=temp_root))
+        try:
+            yield temp_dir
+        finally:
+            # Clean up temporary directory
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir)
+    finally:
+        _release_temp_root(reserved_bytes)
+
+
+def _report_result(success: bool, plan: _VideoPlan, output_file: Path, verbose: bool, error: str) -> bool:
+    """
+    Print the summary for a rendered video, or the error if rendering failed.
+
+    Returns:
+        The success flag, unchanged
+    """
+    if success:
+        reporter = ProgressReporter(verbose)
+        reporter.print_summary(plan.total_duration, plan.output_duration, len(plan.silent_segments))
+        print(f"✓ Saved to: {output_file}")
+    else:
+        print(f"Error: {error}")
+    return success
+
+
+def _report_exception(input_file: Source, error: Exception, verbose: bool) -> bool:
+    """
+    Print an unexpected processing error.
+
+    Returns:
+        Always False
+    """
+    print(f"Error processing {input_file}: {error}")
+    if verbose:
+        import traceback
+        traceback.print_exc()
+    return False
+
+
+def process_video(input_file: Source, output_file: Path, **options) -> bool:
+    """
+    Process a single video file to remove silence.
+
+    Runs process_video_async on its own event loop, see there for the options.
+
+    Returns:
+        True if processing was successful, False otherwise
+    """
+    return asyncio.run(process_video_async(input_file, output_file, **options))
+
+
+async def process_video_async(
+    input_file: Source,
+    output_file: Path,
+    *,
+    threshold: float,
+    min_duration: float,
+    padding: float,
+    verbose: bool,
+    dry_run: bool,
+    export_segments_path: Path = None,
+    first_minutes: float = None,
+    accurate: bool = False,
+    keep_all_streams: bool = False,
+    tmp_dir: Path = None,
+    admission_filter: bool = False,
+    show_progress: bool = True,
+    executor: Optional[Executor] = None,
+) -> bool:
+    """
+    Process a single video file to remove silence, as a coroutine.
+
+    Blocking steps run in the given executor (the loop's default one if None)
+    so many videos can be in flight on one event loop. Without progress bars
+    the final concatenation is awaited as an asyncio subprocess.
+
+    Returns:
+        True if processing was successful, False otherwise
+    """
+    print(f"\nProcessing: {input_file}")
+
+    loop = asyncio.get_running_loop()
+
+    def run_blocking(func, *args, **kwargs):
+        """Run a blocking step in the executor."""
+        return loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+    # Initialize components
+    processor = SegmentProcessor(verbose, keep_all_streams)
+    concatenator = VideoConcatenator(verbose)
 
-        # Step 3: Calculate non-silent segments
-        non_silent_segments = analyzer.calculate_non_silent_segments(
-            silent_segments, total_duration, padding
+    try:
+        plan = await run_blocking(
+            _plan_video,
+            input_file,
+            output_file,
+            threshold=threshold,
+            min_duration=min_duration,
+            padding=padding,
+            verbose=verbose,
+            dry_run=dry_run,
+            export_segments_path=export_segments_path,
+            first_minutes=first_minutes,
+            accurate=accurate,
+            admission_filter=admission_filter,
+            show_progress=show_progress,
         )
+        if plan is None:
+            # Dry-run preview is a success, finding nothing to keep is not
+            return dry_run
 
-        if verbose or dry_run:
-            print(f"\nFound {len(silent_segments)} silent segment(s)")
-            print(f"Keeping {len(non_silent_segments)} non-silent segment(s)")
-
-        # Export segments if requested
-        if export_segments_path:
-            export_data = {
-                "input_file": str(input_file),
-                "total_duration": total_duration,
-                "silent_segments": silent_segments,
-                "non_silent_segments": non_silent_segments,
-            }
-            with open(export_segments_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+        if accurate:
+            # Steps 4-5 fused: trim and join straight from the source, no temp files
             if verbose:
-                print(f"Exported segments to: {export_segments_path}")
-
-        # Calculate statistics
-        silence_duration = sum(end - start for start, end in silent_segments)
-        output_duration = sum(end - start for start, end in non_silent_segments)
+                print("Rendering output in a single pass...")
 
-        if dry_run:
-            print(f"\nDry-run preview:")
-            if max_duration is not None:
-                print(f"  Processing duration: {reporter._format_time(max_duration)} (limited)")
-                print(f"  Original duration:   {reporter._format_time(total_duration)}")
-            else:
-                print(f"  Original duration:   {reporter._format_time(total_duration)}")
-            print(f"  Silence detected:    {reporter._format_time(silence_duration)}")
-            print(f"  Output duration:     {reporter._format_time(output_duration)}")
-            effective_total = max_duration if max_duration is not None else total_duration
-            reduction = (silence_duration / effective_total * 100) if effective_total > 0 else 0
-            print(f"  Reduction:           {reduction:.1f}%")
-            print(f"\nOutput would be saved to: {output_file}")
-            return True
-
-        # Check if there's anything to process
-        if not non_silent_segments:
-            print("\nWarning: No non-silent segments found.")
-            print("The video appears to be entirely silent or audio is very quiet.")
-            print(f"Try adjusting the threshold (current: {threshold}dB)")
-            print("Suggestion: Use a lower threshold like -40dB or -50dB")
-            print("Example: cut-silence input.mp4 --threshold -40")
-            return False
+            success = await run_blocking(
+                concatenator.concatenate_from_source,
+                input_file, plan.non_silent_segments, output_file, show_progress=show_progress,
+            )
+            return _report_result(success, plan, output_file, verbose, "Failed to render output")
 
         # Step 4: Extract segments
         if verbose:
             print("Extracting segments...")
 
-        temp_dir = Path(tempfile.mkdtemp(prefix="cut_silence_"))
-        try:
-            segment_files = processor.extract_segments(
-                input_file, non_silent_segments, temp_dir, show_progress=True
+        with _temp_dir(input_file, plan, tmp_dir) as temp_dir:
+            segment_files = await run_blocking(
+                processor.extract_segments,
+                input_file, plan.non_silent_segments, temp_dir, show_progress=show_progress,
+                segment_time_delta=plan.segment_time_delta,
+                segment_time_offset=plan.segment_time_offset,
             )
 
             if not segment_files:
@@ -254,27 +570,105 @@ def process_video(
             if verbose:
                 print("Concatenating segments...")
 
-            success = concatenator.concatenate_segments(segment_files, output_file, show_progress=True)
-
-            if success:
-                reporter.print_summary(total_duration, output_duration, len(silent_segments))
-                print(f"✓ Saved to: {output_file}")
-                return True
+            if show_progress:
+                # The progress bar follows FFmpeg's output with blocking reads
+                success = await run_blocking(
+                    concatenator.concatenate_segments, segment_files, output_file, show_progress=True
+                )
             else:
-                print("Error: Failed to concatenate segments")
-                return False
-
-        finally:
-            # Clean up temporary directory
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+                success = await concatenator.concatenate_segments_async(segment_files, output_file)
+            return _report_result(success, plan, output_file, verbose, "Failed to concatenate segments")
 
     except Exception as e:
-        print(f"Error processing {input_file}: {e}")
-        if verbose:
-            import traceback
-            traceback.print_exc()
-        return False
+        return _report_exception(input_file, e, verbose)
+
+
+def _batch_paths(
+    input_files: List[Source], output: Path = None, export_segments: Path = None, verbose: bool = False
+) -> List[Tuple[Path, Optional[Path]]]:
+    """
+    Choose the output and segment export path for every file in the batch.
+
+    Paths are picked up front, one file after another, so files processed in
+    parallel never share one: inputs with the same name (e.g. two URLs ending
+    in /video.mp4) get numbered "_cut" paths, and with several inputs each
+    file exports to its own "<export>_<name>.json".
+
+    Returns:
+        (output path, export path or None) for each input file, in input order
+    """
+    concatenator = VideoConcatenator(verbose)
+    taken_outputs = set()
+    taken_exports = set()
+    paths = []
+
+    for input_file in input_files:
+        name = local_name(input_file)
+
+        if output:
+            output_file = output
+        else:
+            output_file = concatenator.generate_output_path(name, OUTPUT_SUFFIX, taken_outputs)
+            taken_outputs.add(output_file)
+
+        export_path = export_segments
+        if export_segments and len(input_files) > 1:
+            # Existing exports are overwritten as with a single input, only
+            # files in this batch must not collide
+            stem = f"{export_segments.stem}_{name.stem}"
+            export_path = export_segments.with_name(f"{stem}{export_segments.suffix}")
+            counter = 1
+            while export_path in taken_exports:
+                export_path = export_segments.with_name(f"{stem}_{counter}{export_segments.suffix}")
+                counter += 1
+            taken_exports.add(export_path)
+
+        paths.append((output_file, export_path))
+
+    return paths
+
+
+async def _process_batch_async(
+    input_files: List[Source], paths: List[Tuple[Path, Optional[Path]]], parallel: int, **options
+) -> List[bool]:
+    """
+    Process several videos concurrently on one event loop.
+
+    At most `parallel` videos are processed at a time, with a thread pool of
+    the same size for their blocking steps (the default executor would cap
+    concurrency at its own size instead). Per-file progress bars are replaced
+    with one bar over the batch.
+
+    Args:
+        input_files: Input videos
+        paths: Output and export path for each input, from _batch_paths
+        parallel: Number of videos processed at a time
+        **options: Options passed to process_video_async
+
+    Returns:
+        Success flag for each input file, in input order
+    """
+    semaphore = asyncio.Semaphore(parallel)
+
+    with ThreadPoolExecutor(max_workers=parallel) as executor, \
+            tqdm(total=len(input_files), desc="Processing files", unit="file") as batch_bar:
+        async def process_one(input_file: Source, output_file: Path, export_path: Optional[Path]) -> bool:
+            async with semaphore:
+                success = await process_video_async(
+                    input_file,
+                    output_file,
+                    export_segments_path=export_path,
+                    show_progress=False,
+                    executor=executor,
+                    **options,
+                )
+            batch_bar.update(1)
+            return success
+
+        return list(await asyncio.gather(*(
+            process_one(input_file, output_file, export_path)
+            for input_file, (output_file, export_path) in zip(input_files, paths)
+        )))
 
 
 def main():
@@ -290,39 +684,42 @@ def main():
         print(f"Padding: {args.padding}s")
         if hasattr(args, 'first_minutes') and args.first_minutes is not None:
             print(f"First minutes: {args.first_minutes}")
+        print(f"Accurate (re-encode): {args.accurate}")
+        print(f"Keep all streams: {args.keep_all_streams}")
+        print(f"Parallel files: {args.parallel}")
         print(f"Dry-run: {args.dry_run}")
         print()
 
-    # Initialize concatenator for output path generation
-    concatenator = VideoConcatenator(args.verbose)
+    # Shared options for every file in the batch
+    options = dict(
+        threshold=args.threshold,
+        min_duration=args.duration,
+        padding=args.padding,
+        verbose=args.verbose,
+        dry_run=args.dry_run,
+        first_minutes=getattr(args, 'first_minutes', None),
+        accurate=args.accurate,
+        keep_all_streams=args.keep_all_streams,
+        tmp_dir=args.tmp_dir,
+        admission_filter=args.admission_filter,
+    )
 
-    success_count = 0
-    failure_count = 0
+    paths = _batch_paths(args.input_files, args.output, args.export_segments, args.verbose)
 
-    for input_file in args.input_files:
-        # Determine output file path
-        if args.output:
-            output_file = args.output
-        else:
-            output_file = concatenator.generate_output_path(input_file, OUTPUT_SUFFIX)
-
-        # Process the video
-        success = process_video(
-            input_file=input_file,
-            output_file=output_file,
-            threshold=args.threshold,
-            min_duration=args.duration,
-            padding=args.padding,
-            verbose=args.verbose,
-            dry_run=args.dry_run,
-            export_segments_path=args.export_segments,
-            first_minutes=getattr(args, 'first_minutes', None),
+    if args.parallel > 1 and len(args.input_files) > 1:
+        # Files are independent and the heavy lifting happens in ffmpeg
+        # subprocesses, so drive them concurrently from one event loop
+        results = asyncio.run(
+            _process_batch_async(args.input_files, paths, args.parallel, **options)
         )
-
-        if success:
-            success_count += 1
-        else:
-            failure_count += 1
+    else:
+        results = [
+            process_video(input_file, output_file, export_segments_path=export_path, **options)
+            for input_file, (output_file, export_path) in zip(args.input_files, paths)
+        ]
+
+    success_count = sum(1 for success in results if success)
+    failure_count = len(results) - success_count
 
     # Print final summary
     print(f"\n{'='*50}")
@@ -3,12 +3,78 @@ Video concatenator module for joining video segments.
 """
 
 from pathlib import Path
-from typing import List
+from typing import Collection, List, Tuple
+import asyncio
+import os
 import subprocess
-import tempfile
-import json
-
-from cut_silence.ffmpeg_runner import FFmpegProgressRunner
+import shutil
+import sys
+
+from cut_silence.config import REENCODE_VIDEO_CODEC, REENCODE_CRF, REENCODE_AUDIO_CODEC
+from cut_silence.ffmpeg_runner import FFmpegProgressRunner, log_args
+from cut_silence.sources import Source, input_args, redact_urls
+
+
+def _build_trim_concat_graph(segments: List[Tuple[float, float]], has_audio: bool = True) -> str:
+    """
+    Build the FFmpeg filter graph that trims each segment and concatenates them.
+
+    Built in a single pass with one join, so the cost stays linear in the
+    number of segments.
+
+    Args:
+        segments: List of (start, end) tuples for segments to keep
+        has_audio: Whether the input has an audio stream to trim alongside the video
+
+    Returns:
+        Filter graph string producing a [v] output, and [a] if has_audio is set
+    """
+    # One trimmed video/audio pair per segment, then concat them all
+    parts = []
+    concat_inputs = []
+    for idx, (start_time, end_time) in enumerate(segments):
+        parts.append(f"[0:v]trim=start={start_time:.6f}:end={end_time:.6f},setpts=PTS-STARTPTS[v{idx}];")
+        if has_audio:
+            parts.append(f"[0:a]atrim=start={start_time:.6f}:end={end_time:.6f},asetpts=PTS-STARTPTS[a{idx}];")
+            concat_inputs.append(f"[v{idx}][a{idx}]")
+        else:
+            concat_inputs.append(f"[v{idx}]")
+
+    parts.extend(concat_inputs)
+    if has_audio:
+        parts.append(f"concat=n={len(segments)}:v=1:a=1[v][a]")
+    else:
+        parts.append(f"concat=n={len(segments)}:v=1:a=0[v]")
+    return "".join(parts)
+
+
+def _has_audio_stream(input_path: Source) -> bool:
+    """
+    Check whether a video has at least one audio stream.
+
+    Args:
+        input_path: Path or URL of the video file
+
+    Returns:
+        True if an audio stream was found, False otherwise
+    """
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=index",
+        "-of", "csv=p=0",
+        *input_args(input_path)
+    ]
+
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+    return result.returncode == 0 and result.stdout.strip() != ""
 
 
 class VideoConcatenator:
@@ -45,82 +111,237 @@ class VideoConcatenator:
                 print("No segments to concatenate")
             return False
 
+        # If only one segment, it is already a valid stream copy, no need to remux
+        if len(segment_files) == 1:
+            return self._place_single_segment(segment_files[0], output_path)
+
         # Estimate total duration for progress tracking
         total_duration = self._estimate_total_duration(segment_files)
 
+        cmd, concat_list = self._build_concat_command(segment_files, output_path, show_progress)
+
         runner = FFmpegProgressRunner()
+        result = runner.run_with_progress(
+            cmd=cmd,
+            description="Concatenating segments",
+            total_duration=total_duration,
+            show_progress=show_progress,
+            input=concat_list
+        )
 
-        # If only one segment, just copy it
-        if len(segment_files) == 1:
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-i", str(segment_files[0]),
-                "-map", "0",
-                "-c", "copy",
-                str(output_path)
-            ]
-            result = runner.run_with_progress(
-                cmd=cmd,
-                description="Copying segment",
-                total_duration=total_duration,
-                show_progress=show_progress
-            )
+        success = result.returncode == 0 and output_path.exists()
+
+        if self.verbose:
+            if success:
+                print(f"Successfully created: {output_path}")
+            else:
+                print(f"Failed to concatenate segments")
+                print(f"FFmpeg stderr: {result.stderr[-500:]}")  # Last 500 chars
+
+        return success
+
+    async def concatenate_segments_async(self, segment_files: List[Path], output_path: Path) -> bool:
+        """
+        Concatenate video segments into a single file without blocking the event loop.
+
+        Same as concatenate_segments, but FFmpeg is awaited as an asyncio
+        subprocess so several concatenations can run from one thread. No
+        progress bar is shown.
+
+        Args:
+            segment_files: List of segment file paths to concatenate
+            output_path: Path for the output video file
 
-            success = result.returncode == 0 and output_path.exists()
+        Returns:
+            True if concatenation was successful, False otherwise
+        """
+        if self.verbose:
+            print(f"Concatenating {len(segment_files)} segments to: {output_path}")
 
+        if not segment_files:
             if self.verbose:
-                if success:
-                    print(f"Successfully created: {output_path}")
-                else:
-                    print(f"Failed to copy segment")
-                    print(f"FFmpeg stderr: {result.stderr[-500:]}")  # Last 500 chars
-
-            return success
-
-        # Create a temporary concat file list
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            concat_file = Path(f.name)
-            for segment_file in segment_files:
-                # Use absolute paths and escape special characters
-                abs_path = segment_file.resolve()
-                f.write(f"file '{abs_path}'\n")
+                print("No segments to concatenate")
+            return False
+
+        # If only one segment, it is already a valid stream copy, no need to remux
+        if len(segment_files) == 1:
+            return self._place_single_segment(segment_files[0], output_path)
+
+        cmd, concat_list = self._build_concat_command(segment_files, output_path, show_progress=False)
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate(input=concat_list.encode())
+
+        success = process.returncode == 0 and output_path.exists()
+
+        if self.verbose:
+            if success:
+                print(f"Successfully created: {output_path}")
+            else:
+                print(f"Failed to concatenate segments")
+                print(f"FFmpeg stderr: {stderr.decode(errors='replace')[-500:]}")  # Last 500 chars
+
+        return success
+
+    def _build_concat_command(
+        self, segment_files: List[Path], output_path: Path, show_progress: bool
+    ) -> Tuple[List[str], str]:
+        """
+        Build the FFmpeg concat demuxer command and the list it reads from stdin.
+
+        Args:
+            segment_files: List of segment file paths to concatenate
+            output_path: Path for the output video file
+            show_progress: Whether progress will be shown (keeps FFmpeg stats enabled)
+
+        Returns:
+            Tuple of (command, concat list text)
+        """
+        # Build the concat list and pipe it to FFmpeg (no temporary list file)
+        concat_list = "".join(
+            # Use absolute file: URLs (plain paths would be resolved relative to
+            # pipe:) and escape single quotes for the concat demuxer
+            "file 'file:{}'\n".format(str(segment_file.resolve()).replace("'", "'\\''"))
+            for segment_file in segment_files
+        )
+
+        # Use FFmpeg concat demuxer to join segments
+        cmd = [
+            "ffmpeg",
+            "-y",
+            *log_args(show_progress),
+            "-f", "concat",
+            "-safe", "0",
+            "-protocol_whitelist", "file,pipe",
+            "-i", "pipe:0",
+            "-map", "0",
+            "-c", "copy",
+            str(output_path)
+        ]
+
+        return cmd, concat_list
+
+    def _place_single_segment(self, segment_file: Path, output_path: Path) -> bool:
+        """
+        Use a single segment as the output file.
+
+        Args:
+            segment_file: The only segment file
+            output_path: Path for the output video file
 
+        Returns:
+            True if the output file was created, False otherwise
+        """
         try:
-            # Use FFmpeg concat demuxer to join segments
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-f", "concat",
-                "-safe", "0",
-                "-i", str(concat_file),
-                "-map", "0",
-                "-c", "copy",
-                str(output_path)
-            ]
-
-            result = runner.run_with_progress(
-                cmd=cmd,
-                description="Concatenating segments",
-                total_duration=total_duration,
-                show_progress=show_progress
-            )
+            self._move_segment(segment_file, output_path)
+        except (OSError, subprocess.SubprocessError) as e:
+            if self.verbose:
+                print(f"Failed to copy segment: {e}")
+            return False
+
+        if self.verbose:
+            print(f"Successfully created: {output_path}")
+        return output_path.exists()
+
+    def concatenate_from_source(
+        self, input_path: Source, segments: List[Tuple[float, float]], output_path: Path, show_progress: bool = True
+    ) -> bool:
+        """
+        Cut and join segments straight from the source video in a single FFmpeg pass.
+
+        Uses a trim/atrim + concat filter graph, so no intermediate segment files are
+        written. Cuts are frame-accurate but the output is re-encoded.
+
+        Args:
+            input_path: Path or URL of the input video file
+            segments: List of (start, end) tuples for segments to keep
+            output_path: Path for the output video file
+            show_progress: Whether to show progress bar
 
-            success = result.returncode == 0 and output_path.exists()
+        Returns:
+            True if processing was successful, False otherwise
+        """
+        if self.verbose:
+            print(f"Rendering {len(segments)} segments from {input_path} to: {output_path}")
 
+        if not segments:
             if self.verbose:
-                if success:
-                    print(f"Successfully created: {output_path}")
-                else:
-                    print(f"Failed to concatenate segments")
-                    print(f"FFmpeg stderr: {result.stderr[-500:]}")  # Last 500 chars
+                print("No segments to concatenate")
+            return False
+
+        # Videos without audio only get the video half of the graph
+        has_audio = _has_audio_stream(input_path)
+        filter_graph = _build_trim_concat_graph(segments, has_audio)
+        audio_args = ["-map", "[a]", "-c:a", REENCODE_AUDIO_CODEC] if has_audio else []
+
+        # The graph grows with the segment count and can exceed the OS limit
+        # for a single argument, so FFmpeg reads it from stdin instead
+        cmd = [
+            "ffmpeg",
+            "-y",
+            *log_args(show_progress),
+            *input_args(input_path),
+            "-filter_complex_script", "pipe:0",
+            "-map", "[v]",
+            "-c:v", REENCODE_VIDEO_CODEC,
+            "-crf", str(REENCODE_CRF),
+            *audio_args,
+            str(output_path)
+        ]
+
+        runner = FFmpegProgressRunner()
+        result = runner.run_with_progress(
+            cmd=cmd,
+            description="Rendering output",
+            total_duration=sum(end - start for start, end in segments),
+            show_progress=show_progress,
+            input=filter_graph
+        )
+
+        success = result.returncode == 0 and output_path.exists()
+
+        if self.verbose:
+            if success:
+                print(f"Successfully created: {output_path}")
+            else:
+                print(f"Failed to render output")
+                print(f"FFmpeg stderr: {redact_urls(result.stderr)[-500:]}")  # Last 500 chars
+
+        return success
+
+    def _move_segment(self, segment_file: Path, output_path: Path) -> None:
+        """
+        Move a single segment file to the output path as cheaply as possible.
+
+        Tries a rename first (same filesystem), then a reflink copy where
+        supported, and finally a regular copy. The segment file may be consumed.
 
-            return success
+        Args:
+            segment_file: Segment file to place at the output path
+            output_path: Path for the output video file
+        """
+        try:
+            os.replace(segment_file, output_path)
+            return
+        except OSError:
+            # Different filesystem, fall back to copying
+            pass
+
+        if sys.platform.startswith("linux"):
+            result = subprocess.run(
+                ["cp", "--reflink=auto", str(segment_file), str(output_path)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+            if result.returncode == 0:
+                return
 
-        finally:
-            # Clean up temporary concat file
-            if concat_file.exists():
-                concat_file.unlink()
+        shutil.copyfile(segment_file, output_path)
 
     def _estimate_total_duration(self, segment_files: List[Path]) -> float:
         """
@@ -140,7 +361,7 @@ class VideoConcatenator:
                     "ffprobe",
                     "-v", "error",
                     "-show_entries", "format=duration",
-                    "-of", "json",
+                    "-of", "default=noprint_wrappers=1:nokey=1",  # Bare value only
                     str(segment_file)
                 ]
 
@@ -152,24 +373,22 @@ class VideoConcatenator:
                 )
 
                 if result.returncode == 0:
-                    data = json.loads(result.stdout)
-                    if "format" in data and "duration" in data["format"]:
-                        duration = float(data["format"]["duration"])
-                        total_duration += duration
-            except (json.JSONDecodeError, ValueError, KeyError):
+                    total_duration += float(result.stdout.strip().splitlines()[0])
+            except (ValueError, IndexError):
                 # If we can't probe a segment, just skip it
                 # Progress bar will still work, just less accurate
                 pass
 
         return total_duration
 
-    def generate_output_path(self, input_path: Path, suffix: str = "_cut") -> Path:
+    def generate_output_path(self, input_path: Path, suffix: str = "_cut", taken: Collection[Path] = ()) -> Path:
         """
         Generate output file path with auto-rename on collision.
 
         Args:
             input_path: Input video file path
             suffix: Suffix to add to filename
+            taken: Paths already handed out but not written yet (they count as collisions)
 
         Returns:
             Output file path (with collision handling)
@@ -183,7 +402,7 @@ class VideoConcatenator:
 
         # Handle file collision with auto-rename
         counter = 1
-        while output_path.exists():
+        while output_path.exists() or output_path in taken:
             output_path = parent / f"{stem}{suffix}_{counter}{ext}"
             counter += 1
 
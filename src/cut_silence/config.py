@@ -2,16 +2,52 @@
 Configuration constants and defaults for Cut-Silence.
 """
 
+import os
+from pathlib import Path
+
 # Default silence detection parameters
 DEFAULT_SILENCE_THRESHOLD = -30  # dB
 DEFAULT_MIN_SILENCE_DURATION = 0.5  # seconds
 DEFAULT_PADDING = 0.0  # seconds
 
+# Keep-ranges separated by no more than this are joined into one segment
+SEGMENT_MERGE_GAP = 0.05  # seconds
+
+# Batch processing (number of files processed at once)
+DEFAULT_PARALLEL = 1
+
+# Temporary segment storage: use tmpfs when the segments fit comfortably
+TMPFS_ROOT = "/dev/shm"
+TMPFS_MAX_FRACTION = 0.5  # of the free space on TMPFS_ROOT
+
 # Output file naming
 OUTPUT_SUFFIX = "_cut"
 
+# Remote inputs passed straight to FFmpeg
+URL_SCHEMES = ("http", "https", "s3")
+S3_PRESIGN_EXPIRY = 6 * 3600  # seconds, long enough for slow runs
+
 # Supported video formats
 SUPPORTED_FORMATS = [".mp4"]
 
+# Admission filter (opt-in with --admission-filter): sample a few short windows
+# before the full silence scan and skip it when every sample is clearly louder
+# than the threshold
+ADMISSION_SAMPLE_WINDOWS = 10
+ADMISSION_WINDOW_DURATION = 1.0  # seconds
+ADMISSION_MARGIN_DB = 6.0
+
+# Re-encoding parameters (only used with --accurate)
+REENCODE_VIDEO_CODEC = "libx264"
+REENCODE_CRF = 18  # Visually lossless for most content
+REENCODE_AUDIO_CODEC = "aac"
+
 # FFmpeg parameters
 FFMPEG_LOGLEVEL = "error"  # Only show errors by default
+STDERR_TAIL_LINES = 200  # stderr lines kept for error reporting when streaming
+
+# Probe cache location
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "cut-silence"
+PROBE_CACHE_FILE = "probe_cache.json"
+PROBE_CACHE_ARRAY_DIR = "arrays"  # keyframe lists, kept out of the JSON index
+PROBE_CACHE_MAX_ENTRIES = 500  # files remembered, least recently stored are dropped
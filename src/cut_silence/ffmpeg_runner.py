@@ -4,9 +4,32 @@ FFmpeg progress runner module for real-time progress tracking.
 
 import re
 import subprocess
-from typing import List
+from collections import deque
+from typing import Callable, List, Optional
 from tqdm import tqdm
 
+from cut_silence.config import FFMPEG_LOGLEVEL, STDERR_TAIL_LINES
+
+
+def log_args(show_progress: bool, loglevel: str = FFMPEG_LOGLEVEL) -> List[str]:
+    """
+    Get FFmpeg logging options that keep stderr small.
+
+    Progress bars need FFmpeg's periodic stats lines, so those are only
+    suppressed (together with everything below loglevel) when no progress
+    is shown.
+
+    Args:
+        show_progress: Whether the command's progress will be displayed
+        loglevel: Log level to use when no progress is shown
+
+    Returns:
+        List of FFmpeg arguments
+    """
+    if show_progress:
+        return ["-hide_banner"]
+    return ["-hide_banner", "-nostats", "-loglevel", loglevel]
+
 
 class FFmpegProgressRunner:
     """
@@ -33,7 +56,9 @@ class FFmpegProgressRunner:
         cmd: List[str],
         description: str,
         total_duration: float,
-        show_progress: bool = True
+        show_progress: bool = True,
+        line_callback: Optional[Callable[[str], None]] = None,
+        input: Optional[str] = None
     ) -> subprocess.CompletedProcess:
         """
         Run FFmpeg command with real-time progress tracking.
@@ -43,14 +68,19 @@ class FFmpegProgressRunner:
             description: Description for progress bar
             total_duration: Total expected duration in seconds
             show_progress: Whether to show progress bar
+            line_callback: Optional function called with each stderr line as it arrives
+            input: Optional text to send to FFmpeg's stdin
 
         Returns:
             CompletedProcess object with returncode, stdout, stderr
         """
-        if not show_progress or total_duration <= 0:
+        show_bar = show_progress and total_duration > 0
+
+        if not show_bar and line_callback is None:
             # Fall back to simple subprocess.run if no progress needed
             return subprocess.run(
                 cmd,
+                input=input,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True
@@ -59,14 +89,21 @@ class FFmpegProgressRunner:
         # Start FFmpeg process
         process = subprocess.Popen(
             cmd,
+            stdin=subprocess.PIPE if input is not None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
             bufsize=1  # Line buffered
         )
 
-        # Collect stderr output for error reporting
-        stderr_lines = []
+        # Send stdin up front so FFmpeg sees EOF before we start reading its output
+        if input is not None:
+            process.stdin.write(input)
+            process.stdin.close()
+
+        # Keep only the tail of stderr for error reporting, so long runs
+        # don't accumulate every progress line in memory
+        stderr_lines = deque(maxlen=STDERR_TAIL_LINES)
 
         # Create progress bar
         with tqdm(
@@ -75,13 +112,16 @@ class FFmpegProgressRunner:
             unit="s",
             unit_scale=True,
             bar_format='{desc}: {percentage:3.0f}%|{bar}| {n:.1f}s/{total:.1f}s [{elapsed}<{remaining}, {rate_fmt}]',
-            disable=False
+            disable=not show_bar
         ) as pbar:
             # Read stderr line by line
             if process.stderr:
                 for line in process.stderr:
                     stderr_lines.append(line)
 
+                    if line_callback is not None:
+                        line_callback(line)
+
                     # Parse progress information
                     current_time = self._parse_time(line)
                     if current_time is not None and current_time <= total_duration:
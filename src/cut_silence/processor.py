@@ -4,35 +4,52 @@ Segment processor module for handling video segments.
 
 from pathlib import Path
 from typing import List, Tuple
-import subprocess
-from tqdm import tqdm
 
-from cut_silence.ffmpeg_runner import FFmpegProgressRunner
+from cut_silence.ffmpeg_runner import FFmpegProgressRunner, log_args
+from cut_silence.sources import Source, input_args, redact_urls
 
 
 class SegmentProcessor:
     """Processes video segments for concatenation."""
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, keep_all_streams: bool = False):
         """
         Initialize segment processor.
 
         Args:
             verbose: Enable verbose output
+            keep_all_streams: Copy every stream instead of only the first video and audio
         """
         self.verbose = verbose
+        self.keep_all_streams = keep_all_streams
 
     def extract_segments(
-        self, video_path: Path, segments: List[Tuple[float, float]], temp_dir: Path, show_progress: bool = True
+        self,
+        video_path: Source,
+        segments: List[Tuple[float, float]],
+        temp_dir: Path,
+        show_progress: bool = True,
+        segment_time_delta: float = 0.0,
+        segment_time_offset: float = 0.0,
     ) -> List[Path]:
         """
         Extract non-silent segments from video.
 
+        All segments are cut in a single FFmpeg pass using the segment muxer, so the
+        input is opened and demuxed once instead of once per segment. The video is
+        split at every segment boundary and only the pieces that correspond to
+        non-silent segments are kept.
+
         Args:
-            video_path: Path to the input video file
+            video_path: Path or URL of the input video file
             segments: List of (start, end) tuples for segments to extract
             temp_dir: Temporary directory for segment files
             show_progress: Whether to show progress bar
+            segment_time_delta: Tolerance in seconds for splitting on a keyframe
+                just after a boundary (use about half a frame when boundaries
+                are keyframe times)
+            segment_time_offset: First video timestamp in seconds; the segment
+                muxer measures split times from it rather than from zero
 
         Returns:
             List of paths to extracted segment files
@@ -43,66 +60,106 @@ class SegmentProcessor:
         # Create temp directory if it doesn't exist
         temp_dir.mkdir(parents=True, exist_ok=True)
 
-        segment_files = []
-        runner = FFmpegProgressRunner()
+        segments = self._normalize_segments(segments)
+        if not segments:
+            return []
+
+        # Split points for the segment muxer (relative to the first video
+        # timestamp), and the index of the piece that starts at each non-silent
+        # segment (piece N starts at boundaries[N-1])
+        boundaries = []
+        keep_indices = []
+        for start_time, end_time in segments:
+            if start_time > segment_time_offset:
+                boundaries.append(start_time - segment_time_offset)
+            keep_indices.append(len(boundaries))
+            boundaries.append(end_time - segment_time_offset)
+
+        last_end = segments[-1][1]
+
+        if self.keep_all_streams:
+            stream_maps = ["-map", "0"]  # Map all streams from input
+        else:
+            # Only the primary video and audio, skip extra tracks, subtitles and
+            # data streams (either may be missing, e.g. for audio-only inputs)
+            stream_maps = ["-map", "0:v:0?", "-map", "0:a:0?"]
+
+        # Use FFmpeg segment muxer with stream copy (no re-encoding for speed)
+        # Pieces are split on the first keyframe at or after each boundary
+        # (minus segment_time_delta)
+        cmd = [
+            "ffmpeg",
+            "-y",  # Overwrite output files
+            *log_args(show_progress),  # Keep stderr small
+            *input_args(video_path),  # Input file (with reconnect options for URLs)
+            "-t", str(last_end),  # Stop reading after the last kept segment
+            *stream_maps,
+            "-c", "copy",  # Copy streams (no re-encoding)
+            "-f", "segment",  # Split output into pieces
+            "-segment_times", ",".join(str(t) for t in boundaries),
+            "-segment_time_delta", str(segment_time_delta),  # Tolerance for keyframe times
+            "-reset_timestamps", "1",  # Each piece starts at timestamp zero
+            "-avoid_negative_ts", "make_zero",  # Fix timestamp issues
+            str(temp_dir / "segment_%04d.mp4")
+        ]
 
-        # Outer progress bar for segment count
-        with tqdm(
-            total=len(segments),
-            desc="Extracting segments",
-            unit="segment",
-            disable=not show_progress,
-            position=0
-        ) as segment_bar:
-            for idx, (start_time, end_time) in enumerate(segments):
-                segment_file = temp_dir / f"segment_{idx:04d}.mp4"
-
-                # Calculate duration
-                duration = end_time - start_time
-
-                # Ensure segment doesn't exceed any time limits
-                if duration <= 0:
-                    if self.verbose:
-                        print(f"Skipping invalid segment {idx} (duration: {duration:.3f}s)")
-                    continue
-
-                # Use FFmpeg to extract segment with stream copy (no re-encoding for speed)
-                # IMPORTANT: -ss MUST be before -i when using -c copy to preserve video stream
-                # This is fast but seeks to nearest keyframe (slightly less accurate)
-                cmd = [
-                    "ffmpeg",
-                    "-y",  # Overwrite output files
-                    "-ss", str(start_time),  # Start time (BEFORE -i for fast seek with copy)
-                    "-i", str(video_path),  # Input file
-                    "-t", str(duration),  # Duration to extract
-                    "-map", "0",  # Map all streams from input
-                    "-c", "copy",  # Copy all streams (no re-encoding)
-                    "-avoid_negative_ts", "make_zero",  # Fix timestamp issues
-                    str(segment_file)
-                ]
-
-                # Run FFmpeg without individual segment progress (just use outer counter)
-                result = runner.run_with_progress(
-                    cmd=cmd,
-                    description=f"  Segment {idx+1}/{len(segments)}",
-                    total_duration=duration,
-                    show_progress=False  # Disable inner progress, rely on outer segment counter
-                )
-
-                if result.returncode == 0 and segment_file.exists():
-                    segment_files.append(segment_file)
-                else:
-                    if self.verbose:
-                        print(f"Warning: Failed to extract segment {idx}")
-
-                # Update outer progress bar
-                segment_bar.update(1)
+        runner = FFmpegProgressRunner()
+        result = runner.run_with_progress(
+            cmd=cmd,
+            description="Extracting segments",
+            total_duration=last_end,
+            show_progress=show_progress
+        )
+
+        if result.returncode != 0:
+            if self.verbose:
+                print("Warning: Failed to extract segments")
+                print(f"FFmpeg stderr: {redact_urls(result.stderr)[-500:]}")  # Last 500 chars
+            return []
+
+        keep = set(keep_indices)
+        segment_files = []
+        # Sort by the numeric index, the names stop sorting as strings past segment_9999
+        pieces = sorted(temp_dir.glob("segment_*.mp4"), key=lambda piece: int(piece.stem.split("_")[1]))
+        for piece in pieces:
+            index = int(piece.stem.split("_")[1])
+            if index in keep:
+                segment_files.append(piece)
+            else:
+                # Silent piece, not needed for concatenation
+                piece.unlink()
 
         if self.verbose:
             print(f"Successfully extracted {len(segment_files)} segments")
 
         return segment_files
 
+    def _normalize_segments(self, segments: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        """
+        Sort segments and merge overlapping ones so boundaries are strictly increasing.
+
+        Args:
+            segments: List of (start, end) tuples
+
+        Returns:
+            List of non-overlapping (start, end) tuples in timeline order
+        """
+        normalized = []
+
+        for start_time, end_time in sorted(segments):
+            if end_time - start_time <= 0:
+                if self.verbose:
+                    print(f"Skipping invalid segment (duration: {end_time - start_time:.3f}s)")
+                continue
+
+            if normalized and start_time <= normalized[-1][1]:
+                # Overlaps or touches the previous segment, extend it instead
+                normalized[-1] = (normalized[-1][0], max(normalized[-1][1], end_time))
+            else:
+                normalized.append((start_time, end_time))
+
+        return normalized
+
     def validate_segments(self, segment_files: List[Path]) -> bool:
         """
         Validate that all segment files were created successfully.
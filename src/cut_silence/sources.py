@@ -0,0 +1,138 @@
+"""
+Input source helpers for local files and remote URLs.
+"""
+
+from pathlib import Path
+from typing import List, Union
+from urllib.parse import urlparse
+import functools
+import re
+
+from cut_silence.config import URL_SCHEMES, S3_PRESIGN_EXPIRY
+
+# An input is either a local file path or a URL string that FFmpeg opens itself
+Source = Union[Path, str]
+
+# Query strings of http(s) URLs, which carry the signature of presigned URLs
+URL_QUERY_RE = re.compile(r'(https?://[^\s?\'"]+)\?[^\s\'":]*')
+
+
+def is_url(source: Source) -> bool:
+    """
+    Check whether an input source is a remote URL.
+
+    Args:
+        source: Local path or URL
+
+    Returns:
+        True if the source is a URL, False otherwise
+    """
+    return isinstance(source, str) and urlparse(source).scheme in URL_SCHEMES
+
+
+def parse_input(value: str) -> Source:
+    """
+    Convert a command line input into a source (argparse type function).
+
+    Args:
+        value: Command line argument
+
+    Returns:
+        The URL string unchanged, or a Path for local files
+    """
+    if urlparse(value).scheme in URL_SCHEMES:
+        return value
+    return Path(value)
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_input(source: Source) -> Source:
+    """
+    Turn a source into something FFmpeg can open directly.
+
+    s3:// URLs are converted to presigned HTTPS URLs (requires boto3). The
+    presigned URL carries credentials, so it is only ever passed to FFmpeg;
+    everything shown to the user keeps the original source. Results are
+    memoized so every FFmpeg call on a source reuses one signature.
+
+    Args:
+        source: Local path or URL
+
+    Returns:
+        Local path, or an http(s) URL
+
+    Raises:
+        RuntimeError: If an s3:// URL can't be presigned
+    """
+    if not is_url(source) or urlparse(source).scheme != "s3":
+        return source
+
+    try:
+        import boto3
+        from botocore.exceptions import BotoCoreError, ClientError
+    except ImportError:
+        raise RuntimeError("s3:// inputs require boto3 (pip install boto3)")
+
+    parsed = urlparse(source)
+    try:
+        return boto3.client("s3").generate_presigned_url(
+            "get_object",
+            Params={"Bucket": parsed.netloc, "Key": parsed.path.lstrip("/")},
+            ExpiresIn=S3_PRESIGN_EXPIRY,
+        )
+    except (BotoCoreError, ClientError) as e:
+        # Missing credentials or region, bad bucket name, etc.
+        raise RuntimeError(f"Could not presign {source}: {e}")
+
+
+def redact_urls(text: str) -> str:
+    """
+    Strip URL query strings from FFmpeg output before it is shown.
+
+    FFmpeg echoes the URLs it opens in its messages, and for presigned s3://
+    inputs the query string holds the signature.
+
+    Args:
+        text: FFmpeg stderr output
+
+    Returns:
+        The text with every http(s) URL query string replaced by "?<redacted>"
+    """
+    return URL_QUERY_RE.sub(r'\1?<redacted>', text)
+
+
+def input_args(source: Source) -> List[str]:
+    """
+    Get the FFmpeg/ffprobe arguments that open a source as an input.
+
+    URLs get reconnect options so dropped connections are resumed instead of
+    failing the whole run, and s3:// URLs are presigned.
+
+    Args:
+        source: Local path or URL
+
+    Returns:
+        List of arguments ending with "-i" and the path or URL to open
+    """
+    options = []
+    if is_url(source):
+        options = ["-reconnect", "1", "-reconnect_streamed", "1", "-reconnect_delay_max", "5"]
+    return [*options, "-i", str(resolve_input(source))]
+
+
+def local_name(source: Source) -> Path:
+    """
+    Get a local path to derive output names from.
+
+    Local files are returned unchanged. URLs map to their file name in the
+    current directory.
+
+    Args:
+        source: Local path or URL
+
+    Returns:
+        Local path
+    """
+    if not is_url(source):
+        return source
+    return Path(Path(urlparse(source).path).name or "video.mp4")
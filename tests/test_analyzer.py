@@ -0,0 +1,45 @@
+"""
+Tests for the silencedetect parser and keep-range calculation.
+"""
+
+import unittest
+
+from cut_silence.analyzer import VideoAnalyzer, _SilenceParser
+
+
+class SilenceParserTest(unittest.TestCase):
+    """Parsing of FFmpeg silencedetect log lines."""
+
+    def test_exponent_timestamps(self):
+        parser = _SilenceParser()
+        parser.feed("[silencedetect @ 0x55d0c8a0] silence_start: 2e-05")
+        parser.feed("[silencedetect @ 0x55d0c8a0] silence_end: 9 | silence_duration: 8.99998")
+
+        self.assertEqual(parser.segments, [(2e-05, 9.0)])
+
+    def test_negative_start(self):
+        parser = _SilenceParser()
+        parser.feed("[silencedetect @ 0x55d0c8a0] silence_start: -0.0213")
+        parser.feed("[silencedetect @ 0x55d0c8a0] silence_end: 1.5 | silence_duration: 1.5213")
+
+        self.assertEqual(parser.segments, [(-0.0213, 1.5)])
+
+
+class NonSilentSegmentsTest(unittest.TestCase):
+    """Keep-range calculation from detected silences."""
+
+    def test_padding_does_not_merge_silences_away(self):
+        analyzer = VideoAnalyzer(-30, 0.5)
+        segments = analyzer.calculate_non_silent_segments([(1, 2), (5, 6)], 10, padding=0.3)
+
+        self.assertEqual(segments, [(0.0, 1.3), (1.7, 5.3), (5.7, 10.0)])
+
+    def test_tiny_gaps_are_merged(self):
+        analyzer = VideoAnalyzer(-30, 0.5)
+        segments = analyzer.calculate_non_silent_segments([(1, 1.02)], 10)
+
+        self.assertEqual(segments, [(0.0, 10.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()